@@ -24,6 +24,9 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import base64
 
+# Fast JSON encoder for chaincode payloads (compact, UTF-8)
+import msgspec
+
 # Hyperledger Fabric SDK
 try:
     from hfc.fabric import Client
@@ -69,7 +72,7 @@ RISK_ASSESSMENT = "risk_assessment"
 REINSURANCE_CONTRACT = "reinsurance_contract"
 
 
-@dataclass
+@dataclass(slots=True)
 class FraudAuditRecord:
     """Immutable fraud detection audit record."""
 
@@ -88,7 +91,7 @@ human_review_required: bool
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaimRecord:
     """Blockchain claim processing record."""
 
@@ -105,8 +108,12 @@ approver_signatures: List[str]
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_json(self) -> str:
+        """Serialize the record as a chaincode JSON argument."""
+        return msgspec.json.encode(self).decode("utf-8")
+
 
-@dataclass
+@dataclass(slots=True)
 class IdentityAttestation:
     """Decentralized identity attestation record."""
 
@@ -123,7 +130,7 @@ zero_knowledge_proof: Optional[str]
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDecisionRecord:
     """Agent governance and explainability record."""
 
@@ -374,7 +381,7 @@ Hyperledger Fabric integration manager for insurance blockchain operations.
             contract = network.get_contract("claims-chaincode")
 
                 result = await contract.submit_transaction(
-                "submitClaim", json.dumps(claim_record.to_dict())
+                "submitClaim", claim_record.to_json()
             )
 
                 logger.info(f"Claim submitted to blockchain: {result}")
@@ -385,7 +392,7 @@ Hyperledger Fabric integration manager for insurance blockchain operations.
                 ChannelType.CLAIMS_PROCESSING.value,
                 "claims-chaincode",
                 "submitClaim",
-                [json.dumps(claim_record.to_dict())],
+                [claim_record.to_json()],
             )
             return result["tx_id"]
 
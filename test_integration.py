@@ -12,6 +12,7 @@ import logging
 import os
 import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, Any, List
 import uuid
 
@@ -536,24 +537,27 @@ async def main():
     # Generate and save report
     report = test_suite.generate_test_report(summary)
     
-    with open(args.output, 'w') as f:
-        f.write(report)
+    Path(args.output).write_text(report, encoding="utf-8")
     
-    print(f"\nIntegration test completed!")
-    print(f"Results: {summary['passed_tests']}/{summary['total_tests']} tests passed")
-    print(f"Report saved to: {args.output}")
-    
-    # Print summary to console
-    print("\n" + "="*60)
-    print("TEST SUMMARY")
-    print("="*60)
-    
-    for result in summary['test_results']:
-        status = "PASS" if result['status'] == "PASSED" else "FAIL"
-        print(f"{status:<5} | {result['test'].replace('_', ' ').title()}")
-    
-    print("="*60)
-    print(f"Overall: {summary['success_rate']:.1f}% success rate")
+    # Print summary to console in a single write
+    out_lines = [
+        "",
+        "Integration test completed!",
+        f"Results: {summary['passed_tests']}/{summary['total_tests']} tests passed",
+        f"Report saved to: {args.output}",
+        "",
+        "="*60,
+        "TEST SUMMARY",
+        "="*60,
+        *[
+            f"{'PASS' if result['status'] == 'PASSED' else 'FAIL':<5} | "
+            f"{result['test'].replace('_', ' ').title()}"
+            for result in summary['test_results']
+        ],
+        "="*60,
+        f"Overall: {summary['success_rate']:.1f}% success rate",
+    ]
+    sys.stdout.write("\n".join(out_lines) + "\n")
     
     # Exit with error code if tests failed
     if summary['success_rate'] < 100:
@@ -7,61 +7,75 @@ detection system components work together correctly.
 """
 
 import asyncio
+import functools
+import importlib
+import importlib.util
 import json
 import logging
 import os
 import sys
 from datetime import datetime
-from typing import Dict, Any
-import uuid
+from typing import Dict
+
+import pytest
+
+# Faster JSON codec when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Faster event loop when available (not supported on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from tests._claims import make_script_claim
+
+# Optional ML and compliance packages
+ENHANCED_PACKAGES = [
+    ("shap", "SHAP for explainable AI"),
+    ("lime", "LIME for model explanations"),
+    ("mlflow", "MLflow for model tracking"),
+    ("evidently", "Evidently for data drift detection"),
+    ("cryptography", "Cryptography for security"),
+]
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def create_test_claim() -> Dict[str, Any]:
-    """Create a sample claim for testing."""
-    return {
-        "claim_id": str(uuid.uuid4()),
-        "policy_number": "POL12345",
-        "claim_amount": 15000.0,
-        "incident_date": "2024-01-10T10:00:00",
-        "reported_date": "2024-01-12T09:00:00",
-        "claim_type": "auto",
-        "description": "Vehicle collision on highway",
-        "location": "Los Angeles, CA",
-        "claimant": {
-            "name": "John Smith",
-            "phone": "555-0123",
-            "email": "john.smith@email.com",
-            "address": "123 Main St, Los Angeles, CA 90210"
-        },
-        "vehicle": {
-            "make": "Toyota",
-            "model": "Camry",
-            "year": 2020,
-            "vin": "1HGBH41JXMN109186"
-        }
-    }
+@functools.lru_cache(maxsize=None)
+def _have(package: str) -> bool:
+    """Check whether a package is installed without executing it."""
+    return importlib.util.find_spec(package) is not None
 
 
 async def test_agent_imports():
     """Test that all agent modules can be imported."""
     logger.info("Testing agent imports...")
     
+    agent_classes = [
+        ("src.agents.enhanced_fraud_detection_agent", "EnhancedFraudDetectionAgent"),
+        ("src.agents.compliance_agent", "ComplianceAgent"),
+        ("src.agents.audit_agent", "AuditAgent"),
+    ]
+    
     try:
-        from src.agents.enhanced_fraud_detection_agent import EnhancedFraudDetectionAgent
-        from src.agents.compliance_agent import ComplianceAgent
-        from src.agents.audit_agent import AuditAgent
+        for module_name, class_name in agent_classes:
+            getattr(importlib.import_module(module_name), class_name)
         
         logger.info("✅ All agent modules imported successfully")
         return True
         
-    except ImportError as e:
+    except (ImportError, AttributeError) as e:
         logger.error(f"❌ Import error: {e}")
         return False
 
@@ -71,11 +85,11 @@ async def test_api_import():
     logger.info("Testing API import...")
     
     try:
-        from src.api.enhanced_fraud_detection import router
+        getattr(importlib.import_module("src.api.enhanced_fraud_detection"), "router")
         logger.info("✅ API module imported successfully")
         return True
         
-    except ImportError as e:
+    except (ImportError, AttributeError) as e:
         logger.error(f"❌ API import error: {e}")
         return False
 
@@ -97,10 +111,9 @@ async def test_dependencies():
     missing_packages = []
     
     for package in required_packages:
-        try:
-            __import__(package)
+        if _have(package):
             logger.info(f"✅ {package} available")
-        except ImportError:
+        else:
             logger.error(f"❌ {package} not available")
             missing_packages.append(package)
     
@@ -112,29 +125,27 @@ async def test_dependencies():
     return True
 
 
-async def test_enhanced_dependencies():
-    """Test enhanced ML and compliance dependencies."""
+@pytest.mark.parametrize("package, description", ENHANCED_PACKAGES)
+def test_enhanced_dependency(package: str, description: str):
+    """Test that an enhanced dependency is installed; skip it otherwise."""
+    if not _have(package):
+        pytest.skip(f"{package} not available - {description}")
+
+
+async def check_enhanced_dependencies():
+    """Check enhanced ML and compliance dependencies."""
     logger.info("Testing enhanced dependencies...")
     
-    enhanced_packages = [
-        ("shap", "SHAP for explainable AI"),
-        ("lime", "LIME for model explanations"),
-        ("mlflow", "MLflow for model tracking"),
-        ("evidently", "Evidently for data drift detection"),
-        ("cryptography", "Cryptography for security"),
-    ]
-    
     available_count = 0
     
-    for package, description in enhanced_packages:
-        try:
-            __import__(package)
+    for package, description in ENHANCED_PACKAGES:
+        if _have(package):
             logger.info(f"✅ {package} available - {description}")
             available_count += 1
-        except ImportError:
+        else:
             logger.warning(f"⚠️ {package} not available - {description}")
     
-    logger.info(f"Enhanced packages available: {available_count}/{len(enhanced_packages)}")
+    logger.info(f"Enhanced packages available: {available_count}/{len(ENHANCED_PACKAGES)}")
     return available_count > 0
 
 
@@ -151,10 +162,20 @@ async def test_file_structure():
         "docs/ENTERPRISE_FRAUD_DETECTION.md"
     ]
     
+    # List each parent directory once instead of stat-ing every file
+    listings: Dict[str, set] = {}
+    for directory in {os.path.dirname(file_path) or "." for file_path in required_files}:
+        try:
+            with os.scandir(directory) as entries:
+                listings[directory] = {entry.name for entry in entries}
+        except OSError:
+            listings[directory] = set()
+    
     missing_files = []
     
     for file_path in required_files:
-        if os.path.exists(file_path):
+        directory, name = os.path.split(file_path)
+        if name in listings[directory or "."]:
             logger.info(f"✅ {file_path} exists")
         else:
             logger.error(f"❌ {file_path} missing")
@@ -174,15 +195,17 @@ async def test_basic_functionality():
     
     try:
         # Test claim data creation
-        claim = create_test_claim()
+        claim = make_script_claim()
         assert "claim_id" in claim
         assert "policy_number" in claim
         assert "claim_amount" in claim
         logger.info("✅ Test claim data creation works")
         
         # Test JSON serialization
-        json_str = json.dumps(claim)
-        parsed_claim = json.loads(json_str)
+        if ORJSON_AVAILABLE:
+            parsed_claim = orjson.loads(orjson.dumps(claim))
+        else:
+            parsed_claim = json.loads(json.dumps(claim))
         assert parsed_claim["claim_id"] == claim["claim_id"]
         logger.info("✅ JSON serialization/deserialization works")
         
@@ -225,7 +248,7 @@ async def run_integration_tests():
     
     tests = [
         ("Dependencies", test_dependencies()),
-        ("Enhanced Dependencies", test_enhanced_dependencies()),
+        ("Enhanced Dependencies", check_enhanced_dependencies()),
         ("File Structure", test_file_structure()),
         ("Agent Imports", test_agent_imports()),
         ("API Import", test_api_import()),
@@ -235,6 +258,9 @@ async def run_integration_tests():
     
     results = []
     
+    # Run sequentially: every check is blocking work (imports, find_spec,
+    # scandir) with no await inside, so gathering them would not overlap
+    # anything and would interleave each check's log lines
     for test_name, test_coro in tests:
         logger.info(f"\nRunning: {test_name}")
         logger.info("-" * 40)
@@ -281,11 +307,14 @@ async def main():
         passed, total = await run_integration_tests()
         
         # Write simple report
+        payload = (
+            "Enhanced Fraud Detection System - Integration Test Results\n"
+            f"Date: {datetime.now().isoformat()}\n"
+            f"Results: {passed}/{total} tests passed\n"
+            f"Success Rate: {passed/total*100:.1f}%\n"
+        )
         with open("integration_test_results.txt", "w") as f:
-            f.write(f"Enhanced Fraud Detection System - Integration Test Results\n")
-            f.write(f"Date: {datetime.now().isoformat()}\n")
-            f.write(f"Results: {passed}/{total} tests passed\n")
-            f.write(f"Success Rate: {passed/total*100:.1f}%\n")
+            f.write(payload)
         
         print(f"\nResults written to: integration_test_results.txt")
         
@@ -298,4 +327,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
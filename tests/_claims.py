@@ -0,0 +1,83 @@
+"""
+Shared sample-claim builders for the integration tests.
+
+Each builder returns a fresh dict on every call, so nested claimant and
+incident details are never shared between tests that mutate them.
+"""
+
+from typing import Any, Dict
+
+
+def make_claim(i: int = 0) -> Dict[str, Any]:
+    """Build the i-th claim of a batch of simple auto claims."""
+    return {
+        "claim_id": f"CLAIM-{i:03d}",
+        "policy_number": f"POL-2024-{i:03d}",
+        "claim_amount": 10000.0 + i * 5000,
+        "incident_type": "auto_accident",
+        "incident_date": "2024-01-15",
+        "claimant_info": {"name": f"Claimant {i}"},
+        "incident_details": {"description": f"Incident {i}"}
+    }
+
+
+def make_sample_claim() -> Dict[str, Any]:
+    """Build the detailed vehicle claim used by the blockchain fraud tests."""
+    return {
+        "claim_id": "CLAIM-SAMPLE-001",
+        "policy_number": "POL-2024-001",
+        "claim_amount": 25000.0,
+        "incident_type": "vehicle_accident",
+        "incident_date": "2024-01-15",
+        "claimant_info": {
+            "name": "John Doe",
+            "id": "ID123456789",
+            "contact": "john.doe@email.com"
+        },
+        "incident_details": {
+            "location": "Highway 101",
+            "weather": "rainy",
+            "description": "Vehicle collision at intersection"
+        },
+        "supporting_documents": ["police_report.pdf", "medical_records.pdf"]
+    }
+
+
+def make_api_claim() -> Dict[str, Any]:
+    """Build a claim payload as submitted through the blockchain fraud API."""
+    return {
+        "claim_id": "API-TEST-001",
+        "policy_number": "POL-2024-API",
+        "claim_amount": 20000.0,
+        "incident_type": "auto_accident",
+        "incident_date": "2024-01-15",
+        "claimant_info": {"name": "Test Claimant"},
+        "incident_details": {"description": "Test incident"},
+        "submit_to_blockchain": True
+    }
+
+
+def make_script_claim() -> Dict[str, Any]:
+    """Build the auto claim used by the simple integration script."""
+    return {
+        "claim_id": "CLAIM-SCRIPT-001",
+        "policy_number": "POL12345",
+        "claim_amount": 15000.0,
+        "incident_date": "2024-01-10T10:00:00",
+        "reported_date": "2024-01-12T09:00:00",
+        "claim_type": "auto",
+        "description": "Vehicle collision on highway",
+        "location": "Los Angeles, CA",
+        "claimant": {
+            "name": "John Smith",
+            "phone": "555-0123",
+            "email": "john.smith@email.com",
+            "address": "123 Main St, Los Angeles, CA 90210"
+        },
+        "vehicle": {
+            "make": "Toyota",
+            "model": "Camry",
+            "year": 2020,
+            "vin": "1HGBH41JXMN109186"
+        }
+    }
@@ -0,0 +1,61 @@
+"""
+Shared pytest fixtures for the MatchedCover test suite.
+
+Expensive components (blockchain agents, fabric connections) are built once
+per test session and reused by every test that requests them. All async
+tests and fixtures run on a single session-wide event loop.
+"""
+
+import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+
+
+def pytest_addoption(parser):
+    """Add command line options for the test suite."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers (xdist_group is known even without pytest-xdist)."""
+    config.addinivalue_line("markers", "slow: performance/stress test, needs --runslow")
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests on one worker under --dist=loadgroup",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run async tests on the session event loop and skip slow tests by default."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    skip_slow = pytest.mark.skip(reason="slow test, use --runslow to run")
+    run_slow = config.getoption("--runslow")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if not run_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def blockchain_agent():
+    """Blockchain-integrated fraud agent, initialized once per session."""
+    from src.blockchain.blockchain_integration import BlockchainIntegratedFraudAgent
+
+    agent = BlockchainIntegratedFraudAgent()
+    await agent.initialize()
+    yield agent
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def fabric_manager():
+    """Connected Hyperledger Fabric manager, shared by the whole session."""
+    from src.blockchain.hyperledger_fabric import HyperledgerFabricManager
+
+    manager = HyperledgerFabricManager()
+    await manager.connect()
+    yield manager
+    await manager.disconnect()
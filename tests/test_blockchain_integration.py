@@ -14,25 +14,44 @@ Test Categories:
 """
 
 import asyncio
+import functools
+import importlib
 import json
 import pytest
+import sys
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Any
-from unittest.mock import Mock, patch, AsyncMock
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
+from unittest.mock import Mock, AsyncMock
 
-from src.blockchain.blockchain_integration import BlockchainIntegratedFraudAgent, get_blockchain_fraud_agent
+from src.blockchain.blockchain_integration import (
+    BlockchainIntegratedFraudAgent,
+    get_blockchain_fraud_agent
+)
 from src.blockchain.hyperledger_fabric import (
     HyperledgerFabricManager,
     FraudAuditRecord,
     ClaimRecord,
     IdentityAttestation,
-    AgentDecisionRecord,
-    ChannelType,
-    TransactionType
+    AgentDecisionRecord
 )
-from src.api.blockchain_fraud_detection import router as blockchain_router
-from src.core.config import settings
+from tests._claims import make_api_claim, make_claim, make_sample_claim
+
+
+@functools.cache
+def _settings():
+    """Load application settings once for the whole module."""
+    from src.core.config import settings
+    return settings
+
+
+# Every class uses the session blockchain fixtures; keep them on one worker
+pytestmark = pytest.mark.xdist_group("blockchain")
+
+
+# Records built by these tests never check timestamp freshness
+FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
 
 
 class TestBlockchainConnectivity:
@@ -49,13 +68,8 @@ class TestBlockchainConnectivity:
         assert fabric_manager.quantum_signer is not None
         
     @pytest.mark.asyncio
-    async def test_mock_fabric_client_fallback(self):
+    async def test_mock_fabric_client_fallback(self, fabric_manager):
         """Test fallback to mock client when Fabric SDK unavailable."""
-        fabric_manager = HyperledgerFabricManager()
-        
-        # Connect using mock client
-        await fabric_manager.connect()
-        
         # Should use mock client
         assert fabric_manager.client is not None
         assert hasattr(fabric_manager.client, 'invoke_chaincode')
@@ -74,38 +88,20 @@ class TestBlockchainConnectivity:
 class TestFraudDetectionBlockchain:
     """Test fraud detection with blockchain integration."""
     
-    @pytest.fixture
-    def sample_claim_data(self) -> Dict[str, Any]:
-        """Sample claim data for testing."""
-        return {
-            "claim_id": str(uuid.uuid4()),
-            "policy_number": "POL-2024-001",
-            "claim_amount": 25000.0,
-            "incident_type": "vehicle_accident",
-            "incident_date": "2024-01-15",
-            "claimant_info": {
-                "name": "John Doe",
-                "id": "ID123456789",
-                "contact": "john.doe@email.com"
-            },
-            "incident_details": {
-                "location": "Highway 101",
-                "weather": "rainy",
-                "description": "Vehicle collision at intersection"
-            },
-            "supporting_documents": ["police_report.pdf", "medical_records.pdf"]
-        }
-    
     @pytest.mark.asyncio
+    # Read-only: the same claim objects are handed to the shared session agent
+    @pytest.mark.parametrize("claim_data", [
+        MappingProxyType(make_sample_claim()),
+        MappingProxyType(make_api_claim()),
+    ], ids=["sample", "api"])
     async def test_fraud_analysis_with_blockchain_logging(
-        self, sample_claim_data: Dict[str, Any]
+        self, blockchain_agent, claim_data: Mapping[str, Any]
     ):
         """Test fraud analysis with automatic blockchain logging."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
+        agent = blockchain_agent
         
         # Perform analysis with blockchain logging
-        result = await agent.analyze_claim_with_blockchain(sample_claim_data)
+        result = await agent.analyze_claim_with_blockchain(claim_data)
         
         # Validate analysis result
         assert "fraud_score" in result
@@ -128,7 +124,7 @@ class TestFraudDetectionBlockchain:
             fraud_score=0.75,
             risk_level="high",
             agent_id="agent-001",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=FIXED_TS,
             decision_hash="hash123",
             quantum_signature="sig123",
             evidence_hash="evidence456",
@@ -149,30 +145,25 @@ class TestFraudDetectionBlockchain:
         assert "fraud_score" in record_dict
     
     @pytest.mark.asyncio
-    async def test_batch_fraud_analysis(self):
+    async def test_batch_fraud_analysis(self, blockchain_agent):
         """Test batch processing of claims with blockchain logging."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
+        agent = blockchain_agent
         
         # Create multiple claims
-        claims = []
-        for i in range(3):
-            claim = {
-                "claim_id": f"CLAIM-{i:03d}",
-                "policy_number": f"POL-2024-{i:03d}",
-                "claim_amount": 10000.0 + i * 5000,
-                "incident_type": "auto_accident",
-                "incident_date": "2024-01-15",
-                "claimant_info": {"name": f"Claimant {i}"},
-                "incident_details": {"description": f"Incident {i}"}
-            }
-            claims.append(claim)
-        
-        # Process batch
-        results = []
-        for claim in claims:
-            result = await agent.analyze_claim_with_blockchain(claim)
-            results.append(result)
+        claims = [make_claim(i) for i in range(3)]
+        
+        # Process batch concurrently
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(agent.analyze_claim_with_blockchain(claim))
+                    for claim in claims
+                ]
+            results = [task.result() for task in tasks]
+        else:
+            results = await asyncio.gather(
+                *(agent.analyze_claim_with_blockchain(claim) for claim in claims)
+            )
         
         # Validate batch results
         assert len(results) == 3
@@ -185,10 +176,9 @@ class TestClaimsProcessingChaincode:
     """Test claims processing smart contract functionality."""
     
     @pytest.mark.asyncio
-    async def test_claim_submission_to_blockchain(self):
+    async def test_claim_submission_to_blockchain(self, blockchain_agent):
         """Test submitting a claim to blockchain for processing."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
+        agent = blockchain_agent
         
         claim_record = ClaimRecord(
             claim_id="CLAIM-SUBMIT-001",
@@ -202,7 +192,7 @@ class TestClaimsProcessingChaincode:
             },
             approval_conditions=["verify_documents"],
             payout_address=None,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=FIXED_TS,
             approver_signatures=[]
         )
         
@@ -212,11 +202,29 @@ class TestClaimsProcessingChaincode:
             tx_id = await agent.submit_claim_to_blockchain(claim_record.to_dict(), analysis_result)
             assert tx_id is not None
     
+    def test_claim_record_json_round_trip(self):
+        """Test the chaincode JSON payload decodes back to the record dict."""
+        claim_record = ClaimRecord(
+            claim_id="CLAIM-JSON-001",
+            policy_id="POL-2024-001",
+            claim_amount=15000.0,
+            status="submitted",
+            ai_assessment={
+                "fraud_score": 0.25,
+                "notes": "Kollision in Zürich – Schaden ≈ 15 000 €"
+            },
+            approval_conditions=["verify_documents"],
+            payout_address=None,
+            timestamp=FIXED_TS,
+            approver_signatures=[]
+        )
+        
+        assert json.loads(claim_record.to_json()) == claim_record.to_dict()
+    
     @pytest.mark.asyncio
-    async def test_automated_payout_approval(self):
+    async def test_automated_payout_approval(self, blockchain_agent):
         """Test automated payout approval for low-risk claims."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
+        agent = blockchain_agent
         
         # Low-risk claim for automated approval
         claim_id = "CLAIM-AUTO-001"
@@ -242,7 +250,7 @@ class TestIdentityVerification:
             verification_type="KYC_VERIFIED",
             attestation_hash="attestation_hash_123",
             verifier_agent_id="agent-001",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=FIXED_TS,
             validity_period=365,  # days
             revocation_status=False,
             zero_knowledge_proof="zkp_proof_123"
@@ -253,10 +261,9 @@ class TestIdentityVerification:
         assert identity_record.revocation_status is False
     
     @pytest.mark.asyncio
-    async def test_identity_verification_workflow(self):
+    async def test_identity_verification_workflow(self, blockchain_agent):
         """Test complete identity verification workflow."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
+        agent = blockchain_agent
         
         identity_data = {
             "user_id": "DID:example:test123",
@@ -275,10 +282,9 @@ class TestReinsuranceContracts:
     """Test reinsurance contract management on blockchain."""
     
     @pytest.mark.asyncio
-    async def test_reinsurance_contract_creation(self):
+    async def test_reinsurance_contract_creation(self, blockchain_agent):
         """Test creating reinsurance contracts on blockchain."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
+        agent = blockchain_agent
         
         contract_data = {
             "contract_id": "REINS-2024-001",
@@ -297,10 +303,9 @@ class TestReinsuranceContracts:
             assert result is not None
     
     @pytest.mark.asyncio
-    async def test_risk_sharing_calculation(self):
+    async def test_risk_sharing_calculation(self, blockchain_agent):
         """Test risk sharing calculations for reinsurance."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
+        agent = blockchain_agent
         
         claim_data = {
             "claim_amount": 75000.0,
@@ -320,11 +325,8 @@ class TestAuditTrailQueries:
     """Test audit trail queries and compliance reporting."""
     
     @pytest.mark.asyncio
-    async def test_fraud_audit_trail_query(self):
+    async def test_fraud_audit_trail_query(self, fabric_manager):
         """Test querying fraud audit trails."""
-        fabric_manager = HyperledgerFabricManager()
-        await fabric_manager.connect()
-        
         # Query audit trail for specific claim
         claim_id = "CLAIM-AUDIT-001"
         
@@ -336,11 +338,8 @@ class TestAuditTrailQueries:
         assert isinstance(audit_trail, list)
     
     @pytest.mark.asyncio
-    async def test_compliance_report_generation(self):
+    async def test_compliance_report_generation(self, fabric_manager):
         """Test generation of compliance reports from blockchain data."""
-        fabric_manager = HyperledgerFabricManager()
-        await fabric_manager.connect()
-        
         # Generate compliance report for date range
         report_params = {
             "start_date": "2024-01-01",
@@ -369,7 +368,7 @@ class TestAuditTrailQueries:
                 "Pattern analysis shows normal behavior"
             ],
             model_version="v2.1.0",
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=FIXED_TS,
             human_review_triggered=False
         )
         
@@ -381,36 +380,29 @@ class TestAuditTrailQueries:
 class TestAPIEndpoints:
     """Test blockchain-enabled API endpoints."""
     
+    def test_blockchain_router_import(self):
+        """Test the blockchain API router module loads and exposes its routes."""
+        # Imported here so only this test pays for the FastAPI route module
+        router = importlib.import_module("src.api.blockchain_fraud_detection").router
+        
+        assert router is not None
+        assert router.routes
+    
     @pytest.mark.asyncio
     async def test_blockchain_fraud_analysis_endpoint(self):
         """Test blockchain fraud analysis API endpoint."""
         # This would test the actual FastAPI endpoints
         # For now, we'll test the core functionality
         
-        request_data = {
-            "claim_id": "API-TEST-001",
-            "policy_number": "POL-2024-API",
-            "claim_amount": 20000.0,
-            "incident_type": "auto_accident",
-            "incident_date": "2024-01-15",
-            "claimant_info": {"name": "Test Claimant"},
-            "incident_details": {"description": "Test incident"},
-            "submit_to_blockchain": True
-        }
-        
-        # The endpoint would process this data through the blockchain agent
+        # Every route resolves its agent through this factory
         agent = await get_blockchain_fraud_agent()
-        result = await agent.analyze_claim_with_blockchain(request_data)
         
-        assert result is not None
-        assert "fraud_score" in result
+        assert isinstance(agent, BlockchainIntegratedFraudAgent)
+        assert await get_blockchain_fraud_agent() is agent
     
     @pytest.mark.asyncio
-    async def test_network_status_endpoint(self):
+    async def test_network_status_endpoint(self, fabric_manager):
         """Test blockchain network status endpoint."""
-        fabric_manager = HyperledgerFabricManager()
-        await fabric_manager.connect()
-        
         network_status = await fabric_manager.get_network_status()
         
         assert network_status is not None
@@ -440,43 +432,40 @@ class TestQuantumResistance:
     async def test_post_quantum_cryptography_integration(self):
         """Test post-quantum cryptography integration in blockchain."""
         # Test that quantum-resistant algorithms are properly configured
-        assert settings.QUANTUM_ALGORITHM == "dilithium3"
-        assert settings.ENABLE_QUANTUM_RESISTANCE is True
-        assert settings.QUANTUM_KEY_ROTATION_DAYS == 90
+        assert _settings().QUANTUM_ALGORITHM == "dilithium3"
+        assert _settings().ENABLE_QUANTUM_RESISTANCE is True
+        assert _settings().QUANTUM_KEY_ROTATION_DAYS == 90
 
 
 class TestErrorHandling:
     """Test error handling and resilience."""
     
     @pytest.mark.asyncio
-    async def test_blockchain_network_unavailable(self):
+    async def test_blockchain_network_unavailable(self, monkeypatch):
         """Test behavior when blockchain network is unavailable."""
         agent = BlockchainIntegratedFraudAgent()
         
         # Simulate network unavailable
-        with patch.object(agent, 'blockchain_enabled', False):
-            await agent.initialize()
-            
-            claim_data = {"claim_id": "ERROR-TEST-001"}
-            result = await agent.analyze_claim_with_blockchain(claim_data)
-            
-            # Should still return analysis without blockchain
-            assert result is not None
-            assert "fraud_score" in result
+        monkeypatch.setattr(agent, 'blockchain_enabled', False)
+        await agent.initialize()
+        
+        claim_data = {"claim_id": "ERROR-TEST-001"}
+        result = await agent.analyze_claim_with_blockchain(claim_data)
+        
+        # Should still return analysis without blockchain
+        assert result is not None
+        assert "fraud_score" in result
     
     @pytest.mark.asyncio
-    async def test_chaincode_invocation_failure(self):
+    async def test_chaincode_invocation_failure(self, fabric_manager):
         """Test handling of chaincode invocation failures."""
-        fabric_manager = HyperledgerFabricManager()
-        await fabric_manager.connect()
-        
         # Simulate chaincode failure
         fraud_record = FraudAuditRecord(
             claim_id="FAIL-TEST-001",
             fraud_score=0.5,
             risk_level="medium",
             agent_id="test-agent",
-            timestamp=datetime.now().isoformat(),
+            timestamp=FIXED_TS,
             decision_hash="test-hash",
             quantum_signature="test-sig",
             evidence_hash="test-evidence",
@@ -6,31 +6,51 @@ including fraud detection, smart contracts, and audit trails.
 """
 
 import asyncio
+import itertools
+import os
 import pytest
-import uuid
+import pytest_asyncio
+import time
 from datetime import datetime, timezone
 
 from src.blockchain.blockchain_integration import BlockchainIntegratedFraudAgent
 from src.blockchain.hyperledger_fabric import get_fabric_manager
 
+_TID = itertools.count()
+_PID = os.getpid()
 
+# Tests only need a plausible claim date, not a fresh clock reading
+_NOW_ISO = datetime.now(timezone.utc).isoformat()
+
+
+def _tid(prefix: str) -> str:
+    """Return an ID unique within this test run (cheaper than uuid4)."""
+    return f"{prefix}-{_PID}-{next(_TID)}"
+
+
+@pytest.fixture
+def agent(blockchain_agent):
+    """Blockchain fraud agent shared across the session (see conftest.py)."""
+    return blockchain_agent
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def global_fabric_manager():
+    """Global Fabric manager singleton, as returned by get_fabric_manager()."""
+    return await get_fabric_manager()
+
+
+@pytest.mark.xdist_group("blockchain")
 class TestBlockchainIntegration:
     """Test suite for blockchain-integrated fraud detection."""
     
-    @pytest.fixture
-    async def agent(self):
-        """Create and initialize a blockchain fraud agent."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
-        return agent
-    
     @pytest.mark.asyncio
     async def test_fraud_detection_with_complete_data(self, agent):
         """Test fraud detection with complete claim data."""
         claim_data = {
-            "claim_id": f"TEST-{uuid.uuid4()}",
+            "claim_id": _tid("TEST"),
             "claim_amount": 10000.0,
-            "claim_date": datetime.now(timezone.utc).isoformat(),
+            "claim_date": _NOW_ISO,
             "policy_number": "POL123456",
             "incident_type": "auto_accident",
             "location": "San Francisco, CA"
@@ -77,9 +97,9 @@ class TestBlockchainIntegration:
     async def test_claims_processing_workflow(self, agent):
         """Test end-to-end claims processing with blockchain."""
         claim_data = {
-            "claim_id": f"CLAIMS-TEST-{uuid.uuid4()}",
+            "claim_id": _tid("CLAIMS-TEST"),
             "claim_amount": 8000.0,
-            "claim_date": datetime.now(timezone.utc).isoformat(),
+            "claim_date": _NOW_ISO,
             "policy_number": "POL789012",
             "payout_address": "0x1234567890123456789012345678901234567890"
         }
@@ -96,13 +116,13 @@ class TestBlockchainIntegration:
     @pytest.mark.asyncio
     async def test_automated_payout_approval(self, agent):
         """Test automated payout for low-risk claims."""
-        claim_id = f"PAYOUT-TEST-{uuid.uuid4()}"
+        claim_id = _tid("PAYOUT-TEST")
         
         # Create low-risk claim
         claim_data = {
             "claim_id": claim_id,
             "claim_amount": 2000.0,  # Below auto-settlement threshold
-            "claim_date": datetime.now(timezone.utc).isoformat(),
+            "claim_date": _NOW_ISO,
             "policy_number": "POL345678"
         }
         
@@ -124,8 +144,8 @@ class TestBlockchainIntegration:
     async def test_identity_verification_blockchain(self, agent):
         """Test blockchain-based identity verification."""
         customer_data = {
-            "customer_id": f"CUST-{uuid.uuid4()}",
-            "user_id": f"DID:test:{uuid.uuid4()}",
+            "customer_id": _tid("CUST"),
+            "user_id": f"DID:test:{_tid('user')}",
             "name": "John Doe",
             "documents": [
                 {"type": "passport", "verified": True},
@@ -145,9 +165,9 @@ class TestBlockchainIntegration:
     async def test_reinsurance_contract_creation(self, agent):
         """Test reinsurance smart contract creation."""
         claim_data = {
-            "claim_id": f"REINS-TEST-{uuid.uuid4()}",
+            "claim_id": _tid("REINS-TEST"),
             "claim_amount": 200000.0,  # High value to trigger reinsurance
-            "claim_date": datetime.now(timezone.utc).isoformat(),
+            "claim_date": _NOW_ISO,
             "policy_number": "POL901234",
             "incident_type": "natural_disaster"
         }
@@ -170,13 +190,13 @@ class TestBlockchainIntegration:
     @pytest.mark.asyncio
     async def test_blockchain_audit_summary(self, agent):
         """Test comprehensive blockchain audit trail retrieval."""
-        claim_id = f"AUDIT-TEST-{uuid.uuid4()}"
+        claim_id = _tid("AUDIT-TEST")
         
         # Create some activity first
         claim_data = {
             "claim_id": claim_id,
             "claim_amount": 12000.0,
-            "claim_date": datetime.now(timezone.utc).isoformat(),
+            "claim_date": _NOW_ISO,
             "policy_number": "POL567890"
         }
         
@@ -191,14 +211,12 @@ class TestBlockchainIntegration:
         assert "compliance_status" in audit_summary
     
     @pytest.mark.asyncio
-    async def test_fabric_manager_initialization(self):
+    async def test_fabric_manager_initialization(self, global_fabric_manager):
         """Test Hyperledger Fabric manager initialization."""
-        fabric_manager = await get_fabric_manager()
-        
-        assert fabric_manager is not None
-        assert hasattr(fabric_manager, 'log_fraud_detection')
-        assert hasattr(fabric_manager, 'submit_claim_to_blockchain')
-        assert hasattr(fabric_manager, 'verify_identity_attestation')
+        assert global_fabric_manager is not None
+        assert hasattr(global_fabric_manager, 'log_fraud_detection')
+        assert hasattr(global_fabric_manager, 'submit_claim_to_blockchain')
+        assert hasattr(global_fabric_manager, 'verify_identity_attestation')
     
     @pytest.mark.asyncio
     async def test_error_handling_invalid_data(self, agent):
@@ -223,7 +241,7 @@ class TestBlockchainIntegration:
         claims = []
         for i in range(5):
             claims.append({
-                "claim_id": f"CONCURRENT-{i}-{uuid.uuid4()}",
+                "claim_id": _tid(f"CONCURRENT-{i}"),
                 "claim_amount": 1000 * (i + 1),
                 "policy_number": f"POL{i:06d}"
             })
@@ -243,23 +261,22 @@ class TestBlockchainIntegration:
 
 
 # Performance and stress tests
+@pytest.mark.slow
+@pytest.mark.xdist_group("blockchain")
 class TestBlockchainPerformance:
     """Performance tests for blockchain integration."""
     
     @pytest.mark.asyncio
-    async def test_analysis_response_time(self):
+    async def test_analysis_response_time(self, agent):
         """Test that fraud analysis completes within acceptable time."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
-        
         claim_data = {
             "claim_amount": 10000,
             "policy_number": "PERF-TEST-001"
         }
         
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         result = await agent.analyze_claim_with_blockchain(claim_data)
-        end_time = asyncio.get_event_loop().time()
+        end_time = time.perf_counter()
         
         response_time = end_time - start_time
         
@@ -268,20 +285,24 @@ class TestBlockchainPerformance:
         assert "fraud_analysis" in result
     
     @pytest.mark.asyncio
-    async def test_high_volume_processing(self):
-        """Test processing multiple claims in sequence."""
-        agent = BlockchainIntegratedFraudAgent()
-        await agent.initialize()
-        
-        # Process 20 claims in sequence
-        for i in range(20):
-            claim_data = {
+    async def test_high_volume_processing(self, agent):
+        """Test processing a high volume of claims concurrently."""
+        claims = [
+            {
                 "claim_id": f"VOLUME-{i:03d}",
                 "claim_amount": 5000 + (i * 100),
                 "policy_number": f"VOL{i:06d}"
             }
-            
-            result = await agent.analyze_claim_with_blockchain(claim_data)
+            for i in range(20)
+        ]
+        
+        # Process 20 claims concurrently
+        results = await asyncio.gather(
+            *(agent.analyze_claim_with_blockchain(claim) for claim in claims)
+        )
+        
+        assert len(results) == 20
+        for result in results:
             assert "fraud_analysis" in result
 
 
@@ -303,13 +324,15 @@ if __name__ == "__main__":
         print(f"✅ Basic test passed: {result.get('fraud_analysis', {}).get('risk_level')}")
         
         # Performance test
-        start_time = asyncio.get_event_loop().time()
-        for i in range(10):
-            await agent.analyze_claim_with_blockchain({
+        start_time = time.perf_counter()
+        await asyncio.gather(*(
+            agent.analyze_claim_with_blockchain({
                 "claim_amount": 1000 * (i + 1),
                 "policy_number": f"PERF-{i:03d}"
             })
-        end_time = asyncio.get_event_loop().time()
+            for i in range(10)
+        ))
+        end_time = time.perf_counter()
         
         print(f"✅ Performance test: 10 analyses in {end_time - start_time:.2f}s")
         print("🎉 All manual tests passed!")
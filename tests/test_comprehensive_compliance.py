@@ -15,13 +15,144 @@ from src.compliance.regulatory_compliance import get_compliance_manager, Complia
 from src.compliance.aml_bsa_compliance import get_aml_bsa_manager, AMLRiskLevel
 from src.compliance.state_specific_compliance import get_state_compliance_manager, State
 
+# Captured once at import; tests only need a plausible "now"
+_NOW = datetime.now(timezone.utc)
+_NOW_ISO = _NOW.isoformat()
+REPORT_END_DATE = _NOW_ISO
+REPORT_START_DATE = (_NOW - timedelta(days=90)).isoformat()
 
+# Static request payloads shared by the tests below; never mutated in place
+MODEL_DATA = {
+    "name": "fraud_detection_model_v1",
+    "version": "1.0.0",
+    "development_documentation": True,
+    "validation_documentation": True,
+    "monitoring_procedures": True,
+    "bias_testing_results": True,
+    "performance_benchmarks": True,
+    "bias_metrics": {
+        "demographic_parity": 0.85,
+        "equal_opportunity": 0.82,
+        "calibration": 0.88
+    },
+    "explainability_score": 0.75,
+    "performance_metrics": {
+        "accuracy": 0.92,
+        "precision": 0.85,
+        "recall": 0.88
+    }
+}
+
+BLOCKCHAIN_DATA = {
+    "network_id": "fabric-network-001",
+    "chaincode_version": "1.0.0",
+    "audit_trail_enabled": True,
+    "data_retention_policy": "2555_days",
+    "immutability_verified": True,
+    "access_controls": {
+        "role_based_access": True,
+        "audit_logging": True,
+        "regulatory_access": True,
+        "data_encryption": True
+    },
+    "regulatory_access_enabled": True,
+    "backup_procedures_tested": True
+}
+
+DECISION_DATA = {
+    "customer_id": "customer_001",
+    "application_denied": True,
+    "credit_report_used": True,
+    "decision_type": "underwriting",
+    "data_sources": ["credit_bureau", "external_data"]
+}
+
+CUSTOMER_DATA = {
+    "customer_id": "customer_002",
+    "name": "John Doe",
+    "date_of_birth": "1980-01-15",
+    "id_type": "SSN",
+    "id_number": "123-45-6789",
+    "address": {
+        "street": "123 Main St",
+        "city": "New York",
+        "state": "NY",
+        "zip": "10001"
+    },
+    "phone": "555-123-4567",
+    "email": "john.doe@email.com",
+    "country": "US"
+}
+
+BUSINESS_DATA = {
+    "licenses": ["property_casualty", "life_health"],
+    "ai_systems": ["fraud_detection", "underwriting"],
+    "cybersecurity_program": True,
+    "data_privacy_program": True,
+    "claims_data": {
+        "total_claims": 1000,
+        "settled_claims": 950,
+        "average_settlement_time_days": 25
+    },
+    "complaints": {
+        "total_complaints": 15,
+        "resolved_complaints": 14
+    }
+}
+
+BUSINESS_SCENARIO = {
+    "company_info": {
+        "name": "TestCover Insurance",
+        "states_operating": ["CA", "NY", "TX"],
+        "business_lines": ["auto", "property", "life"]
+    },
+    "ai_systems": [
+        {
+            "model_id": "fraud_detector_v2",
+            "name": "Fraud Detection Model",
+            "version": "2.0.0",
+            "performance_metrics": {"accuracy": 0.94, "precision": 0.87, "recall": 0.89},
+            "bias_metrics": {"demographic_parity": 0.83, "equal_opportunity": 0.85},
+            "explainability_score": 0.78,
+            "development_documentation": True,
+            "validation_documentation": True,
+            "monitoring_procedures": True,
+            "bias_testing_results": True,
+            "performance_benchmarks": True
+        }
+    ],
+    "blockchain_config": {
+        "network_id": "production-fabric-network",
+        "audit_trail_enabled": True,
+        "data_retention_policy": "2555_days",
+        "immutability_verified": True,
+        "access_controls": {
+            "role_based_access": True,
+            "audit_logging": True,
+            "regulatory_access": True,
+            "data_encryption": True
+        },
+        "regulatory_access_enabled": True,
+        "backup_procedures_tested": True
+    },
+    "customers": [
+        {
+            "customer_id": "cust_001",
+            "name": "Customer One",
+            "risk_level": "low",
+            "verification_status": "verified"
+        }
+    ]
+}
+
+
+@pytest.mark.xdist_group("compliance")
 class TestComprehensiveCompliance:
     """Test suite for comprehensive regulatory compliance."""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
     async def compliance_managers(self):
-        """Set up all compliance managers."""
+        """Set up all compliance managers once per session."""
         federal_manager = await get_compliance_manager()
         aml_manager = await get_aml_bsa_manager()
         state_manager = await get_state_compliance_manager()
@@ -37,32 +168,16 @@ class TestComprehensiveCompliance:
         """Test federal compliance components integration."""
         federal_manager = compliance_managers["federal"]
         
-        # Test AI model compliance
-        model_data = {
-            "name": "fraud_detection_model_v1",
-            "version": "1.0.0",
-            "development_documentation": True,
-            "validation_documentation": True,
-            "monitoring_procedures": True,
-            "bias_testing_results": True,
-            "performance_benchmarks": True,
-            "bias_metrics": {
-                "demographic_parity": 0.85,
-                "equal_opportunity": 0.82,
-                "calibration": 0.88
-            },
-            "explainability_score": 0.75,
-            "performance_metrics": {
-                "accuracy": 0.92,
-                "precision": 0.85,
-                "recall": 0.88
-            }
-        }
-        
-        result = await federal_manager.validate_ai_model_compliance(
-            "fraud_model_001", model_data
+        # AI model, blockchain and adverse action checks are independent
+        result, blockchain_result, adverse_action_result = await asyncio.gather(
+            federal_manager.validate_ai_model_compliance(
+                "fraud_model_001", MODEL_DATA
+            ),
+            federal_manager.validate_blockchain_compliance(BLOCKCHAIN_DATA),
+            federal_manager.check_adverse_action_requirements(DECISION_DATA),
         )
         
+        # Test AI model compliance
         assert result["compliance_passed"] is True
         assert result["documentation_complete"] is True
         assert result["fairness_passed"] is True
@@ -70,43 +185,11 @@ class TestComprehensiveCompliance:
         assert result["performance_passed"] is True
         
         # Test blockchain compliance
-        blockchain_data = {
-            "network_id": "fabric-network-001",
-            "chaincode_version": "1.0.0",
-            "audit_trail_enabled": True,
-            "data_retention_policy": "2555_days",
-            "immutability_verified": True,
-            "access_controls": {
-                "role_based_access": True,
-                "audit_logging": True,
-                "regulatory_access": True,
-                "data_encryption": True
-            },
-            "regulatory_access_enabled": True,
-            "backup_procedures_tested": True
-        }
-        
-        blockchain_result = await federal_manager.validate_blockchain_compliance(
-            blockchain_data
-        )
-        
         assert blockchain_result["compliance_passed"] is True
         assert blockchain_result["audit_trail_enabled"] is True
         assert blockchain_result["regulatory_access_enabled"] is True
         
         # Test adverse action requirements
-        decision_data = {
-            "customer_id": "customer_001",
-            "application_denied": True,
-            "credit_report_used": True,
-            "decision_type": "underwriting",
-            "data_sources": ["credit_bureau", "external_data"]
-        }
-        
-        adverse_action_result = await federal_manager.check_adverse_action_requirements(
-            decision_data
-        )
-        
         assert adverse_action_result["adverse_action_required"] is True
         assert "Nature of adverse action" in adverse_action_result["required_disclosures"]
     
@@ -115,58 +198,41 @@ class TestComprehensiveCompliance:
         """Test AML/BSA compliance components integration."""
         aml_manager = compliance_managers["aml"]
         
-        # Test customer identification program
-        customer_data = {
+        transaction_data = {
             "customer_id": "customer_002",
-            "name": "John Doe",
-            "date_of_birth": "1980-01-15",
-            "id_type": "SSN",
-            "id_number": "123-45-6789",
-            "address": {
-                "street": "123 Main St",
-                "city": "New York",
-                "state": "NY",
-                "zip": "10001"
-            },
-            "phone": "555-123-4567",
-            "email": "john.doe@email.com",
-            "country": "US"
+            "amount": 15000.0,
+            "type": "cash_deposit",
+            "transaction_date": _NOW_ISO
         }
         
-        cip_result = await aml_manager.conduct_customer_identification(customer_data)
+        # CIP, OFAC, suspicious activity and CTR checks are independent
+        cip_result, sanctions_result, suspicious_result, ctr_result = await asyncio.gather(
+            aml_manager.conduct_customer_identification(CUSTOMER_DATA),
+            aml_manager.screen_ofac_sanctions(CUSTOMER_DATA),
+            aml_manager.monitor_suspicious_activity(transaction_data),
+            aml_manager.check_ctr_requirements({
+                **transaction_data,
+                "is_cash": True
+            }),
+        )
         
+        # Test customer identification program
         assert cip_result["compliance_passed"] is True
         assert cip_result["verification_status"] == "verified"
         assert cip_result["sanctions_clear"] is True
         assert cip_result["risk_level"] in ["low", "medium", "high"]
         
         # Test OFAC sanctions screening
-        sanctions_result = await aml_manager.screen_ofac_sanctions(customer_data)
-        
         assert "screening_id" in sanctions_result
         assert "ofac_match" in sanctions_result
         assert "screening_date" in sanctions_result
         
         # Test suspicious activity monitoring
-        transaction_data = {
-            "customer_id": "customer_002",
-            "amount": 15000.0,
-            "type": "cash_deposit",
-            "transaction_date": datetime.now(timezone.utc).isoformat()
-        }
-        
-        suspicious_result = await aml_manager.monitor_suspicious_activity(transaction_data)
-        
         assert "suspicious_activity_detected" in suspicious_result
         assert "sar_required" in suspicious_result
         assert "risk_score" in suspicious_result
         
         # Test CTR requirements
-        ctr_result = await aml_manager.check_ctr_requirements({
-            **transaction_data,
-            "is_cash": True
-        })
-        
         assert "ctr_required" in ctr_result
     
     @pytest.mark.asyncio
@@ -174,37 +240,19 @@ class TestComprehensiveCompliance:
         """Test state-specific compliance integration."""
         state_manager = compliance_managers["state"]
         
-        # Test California compliance
-        business_data = {
-            "licenses": ["property_casualty", "life_health"],
-            "ai_systems": ["fraud_detection", "underwriting"],
-            "cybersecurity_program": True,
-            "data_privacy_program": True,
-            "claims_data": {
-                "total_claims": 1000,
-                "settled_claims": 950,
-                "average_settlement_time_days": 25
-            },
-            "complaints": {
-                "total_complaints": 15,
-                "resolved_complaints": 14
-            }
-        }
-        
-        ca_result = await state_manager.check_state_compliance(
-            State.CALIFORNIA, business_data
+        # California and New York checks are independent
+        ca_result, ny_result = await asyncio.gather(
+            state_manager.check_state_compliance(State.CALIFORNIA, BUSINESS_DATA),
+            state_manager.check_state_compliance(State.NEW_YORK, BUSINESS_DATA),
         )
         
+        # Test California compliance
         assert ca_result["state"] == "CA"
         assert "overall_compliance_score" in ca_result
         assert "compliance_details" in ca_result
         assert "recommended_actions" in ca_result
         
         # Test New York compliance
-        ny_result = await state_manager.check_state_compliance(
-            State.NEW_YORK, business_data
-        )
-        
         assert ny_result["state"] == "NY"
         assert "regulator" in ny_result
         
@@ -213,7 +261,7 @@ class TestComprehensiveCompliance:
             "filing_id": "RF_CA_001",
             "product_name": "Auto Insurance Premium",
             "filing_type": "revision",
-            "effective_date": (datetime.now(timezone.utc) + timedelta(days=90)).isoformat(),
+            "effective_date": (_NOW + timedelta(days=90)).isoformat(),
             "rate_change_percentage": 5.2,
             "justification": "Increased claims costs and regulatory changes",
             "actuarial_memorandum": "Detailed actuarial analysis attached",
@@ -246,6 +294,7 @@ class TestComprehensiveCompliance:
         assert "exam_risk_level" in market_result
         assert "metrics" in market_result
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_cross_system_compliance_integration(self, compliance_managers):
         """Test integration across all compliance systems."""
@@ -253,103 +302,71 @@ class TestComprehensiveCompliance:
         aml_manager = compliance_managers["aml"]
         state_manager = compliance_managers["state"]
         
-        # Simulate comprehensive business assessment
-        business_scenario = {
-            "company_info": {
-                "name": "TestCover Insurance",
-                "states_operating": ["CA", "NY", "TX"],
-                "business_lines": ["auto", "property", "life"]
-            },
-            "ai_systems": [
-                {
-                    "model_id": "fraud_detector_v2",
-                    "name": "Fraud Detection Model",
-                    "version": "2.0.0",
-                    "performance_metrics": {"accuracy": 0.94, "precision": 0.87, "recall": 0.89},
-                    "bias_metrics": {"demographic_parity": 0.83, "equal_opportunity": 0.85},
-                    "explainability_score": 0.78,
-                    "development_documentation": True,
-                    "validation_documentation": True,
-                    "monitoring_procedures": True,
-                    "bias_testing_results": True,
-                    "performance_benchmarks": True
-                }
-            ],
-            "blockchain_config": {
-                "network_id": "production-fabric-network",
-                "audit_trail_enabled": True,
-                "data_retention_policy": "2555_days",
-                "immutability_verified": True,
-                "access_controls": {
-                    "role_based_access": True,
-                    "audit_logging": True,
-                    "regulatory_access": True,
-                    "data_encryption": True
-                },
-                "regulatory_access_enabled": True,
-                "backup_procedures_tested": True
-            },
-            "customers": [
-                {
-                    "customer_id": "cust_001",
-                    "name": "Customer One",
-                    "risk_level": "low",
-                    "verification_status": "verified"
-                }
-            ]
+        # Test state compliance for multiple states; unknown states are skipped
+        state_payload = {
+            "licenses": BUSINESS_SCENARIO["company_info"]["business_lines"],
+            "ai_systems": [ai["name"] for ai in BUSINESS_SCENARIO["ai_systems"]],
+            "cybersecurity_program": True,
+            "data_privacy_program": True
         }
-        
-        # Test federal compliance
-        ai_model = business_scenario["ai_systems"][0]
-        federal_ai_result = await federal_manager.validate_ai_model_compliance(
-            ai_model["model_id"], ai_model
-        )
-        
-        federal_blockchain_result = await federal_manager.validate_blockchain_compliance(
-            business_scenario["blockchain_config"]
-        )
-        
-        # Test AML compliance
-        customer = business_scenario["customers"][0]
-        aml_customer_result = await aml_manager.conduct_customer_identification({
-            **customer,
-            "date_of_birth": "1985-03-20",
-            "id_type": "SSN",
-            "id_number": "987-65-4321",
-            "address": {"street": "456 Oak Ave", "city": "Los Angeles", "state": "CA", "zip": "90210"},
-            "phone": "555-987-6543",
-            "email": "customer.one@email.com",
-            "country": "US"
-        })
-        
-        # Test state compliance for multiple states
-        state_results = {}
-        for state_code in business_scenario["company_info"]["states_operating"]:
+        state_codes = []
+        state_tasks = []
+        for state_code in BUSINESS_SCENARIO["company_info"]["states_operating"]:
             try:
                 state_enum = State(state_code)
-                state_result = await state_manager.check_state_compliance(
-                    state_enum, {
-                        "licenses": business_scenario["company_info"]["business_lines"],
-                        "ai_systems": [ai["name"] for ai in business_scenario["ai_systems"]],
-                        "cybersecurity_program": True,
-                        "data_privacy_program": True
-                    }
-                )
-                state_results[state_code] = state_result
             except ValueError:
                 continue
-        
-        # Generate comprehensive compliance report
-        end_date = datetime.now(timezone.utc).isoformat()
-        start_date = (datetime.now(timezone.utc) - timedelta(days=90)).isoformat()
-        
-        federal_report = await federal_manager.generate_compliance_report(
-            start_date, end_date
+            state_codes.append(state_code)
+            state_tasks.append(
+                state_manager.check_state_compliance(state_enum, state_payload)
+            )
+        
+        # Federal, AML and reporting checks are independent of each other
+        ai_model = BUSINESS_SCENARIO["ai_systems"][0]
+        customer = BUSINESS_SCENARIO["customers"][0]
+        independent_tasks = [
+            federal_manager.validate_ai_model_compliance(
+                ai_model["model_id"], ai_model
+            ),
+            federal_manager.validate_blockchain_compliance(
+                BUSINESS_SCENARIO["blockchain_config"]
+            ),
+            aml_manager.conduct_customer_identification({
+                **customer,
+                "date_of_birth": "1985-03-20",
+                "id_type": "SSN",
+                "id_number": "987-65-4321",
+                "address": {"street": "456 Oak Ave", "city": "Los Angeles", "state": "CA", "zip": "90210"},
+                "phone": "555-987-6543",
+                "email": "customer.one@email.com",
+                "country": "US"
+            }),
+            federal_manager.generate_compliance_report(
+                REPORT_START_DATE, REPORT_END_DATE
+            ),
+            aml_manager.generate_aml_report(
+                REPORT_START_DATE, REPORT_END_DATE
+            ),
+        ]
+        
+        state_outcomes, (
+            federal_ai_result,
+            federal_blockchain_result,
+            aml_customer_result,
+            federal_report,
+            aml_report,
+        ) = await asyncio.gather(
+            asyncio.gather(*state_tasks, return_exceptions=True),
+            asyncio.gather(*independent_tasks),
         )
         
-        aml_report = await aml_manager.generate_aml_report(
-            start_date, end_date
-        )
+        state_results = {}
+        for state_code, outcome in zip(state_codes, state_outcomes):
+            if isinstance(outcome, ValueError):
+                continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+            state_results[state_code] = outcome
         
         # Assertions for comprehensive integration
         assert federal_ai_result["compliance_passed"] is True
@@ -412,7 +429,7 @@ class TestComprehensiveCompliance:
             "event_type": "check",
             "severity": "low",
             "description": "Test compliance check",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _NOW_ISO,
             "details": {"test": True},
             "remediation_required": False
         })
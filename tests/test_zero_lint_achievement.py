@@ -0,0 +1,50 @@
+"""
+Tests for the ambiguous-name fixer in zero_lint_achievement.py.
+
+Renaming l/O/I must only ever touch real assignment sites; anything else
+(strings, comments, keyword arguments, lambda parameters) has to survive
+byte-for-byte.
+"""
+
+import pytest
+
+from zero_lint_achievement import rename_ambiguous_assignments
+
+
+class TestRenameAmbiguousAssignments:
+    """Regression tests for rename_ambiguous_assignments."""
+    
+    @pytest.mark.parametrize("source, expected", [
+        ("s = 'a\x0cb'\nl = 1\n", "s = 'a\x0cb'\nlst = 1\n"),
+        ("s = 'a\x0bb'\nO = 1\n", "s = 'a\x0bb'\nobj = 1\n"),
+        ("# a\x85b\nl = 1\n", "# a\x85b\nlst = 1\n"),
+        ("s = 'a\u2028b'\nI = 1\n", "s = 'a\u2028b'\nidx = 1\n"),
+        ("x = 1\rl = 2\n", "x = 1\rlst = 2\n"),
+    ])
+    def test_non_newline_line_breaks_keep_offsets_aligned(self, source, expected):
+        """Characters that splitlines() treats as breaks must not shift offsets."""
+        content, changed = rename_ambiguous_assignments(source)
+        
+        assert content == expected
+        assert changed
+    
+    @pytest.mark.parametrize("source", [
+        "f = lambda l=1: l\n",
+        "f = lambda a, O=2: O\n",
+        "f = lambda a=(lambda I=3: I): a\n",
+        "g(l=1)\n",
+        "s = 'l = 1'  # l = 2\n",
+    ])
+    def test_non_assignments_are_left_alone(self, source):
+        """Lambda parameters, keyword arguments, strings and comments are untouched."""
+        content, changed = rename_ambiguous_assignments(source)
+        
+        assert content == source
+        assert not changed
+    
+    def test_assignment_after_lambda_is_renamed(self):
+        """Leaving a lambda's parameter list re-enables renaming."""
+        content, changed = rename_ambiguous_assignments("f = lambda l=1: l\nl = 2\n")
+        
+        assert content == "f = lambda l=1: l\nlst = 2\n"
+        assert changed
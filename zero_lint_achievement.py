@@ -4,218 +4,335 @@ Final comprehensive script to achieve absolutely zero linting errors.
 Fixes all remaining issues systematically and safely.
 """
 
+import hashlib
+import io
+import json
 import os
 import re
-import subprocess
-
-def fix_syntax_errors():
-    """Fix unterminated string literals."""
-    print("Fixing syntax errors (E999)...")
-    
-    for root, dirs, files in os.walk('src'):
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                original_content = content
-                
-                # Fix 4 quotes -> 3 quotes
-                content = re.sub(r'""""', '"""', content)
-                
-                # Fix broken docstrings at start of files
-                lines = content.split('\n')
-                if lines and lines[0].strip().startswith('""""'):
-                    lines[0] = lines[0].replace('""""', '"""')
-                
-                content = '\n'.join(lines)
-                
-                if content != original_content:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
-
-def fix_whitespace_issues():
-    """Fix all whitespace-related issues."""
-    print("Fixing whitespace issues...")
-    
-    for root, dirs, files in os.walk('src'):
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                original_content = content
-                
-                # Fix tabs to spaces
-                content = content.expandtabs(4)
-                
-                # Fix trailing whitespace and blank line whitespace
-                lines = content.split('\n')
-                fixed_lines = []
-                
-                for line in lines:
-                    # Remove trailing whitespace
-                    fixed_lines.append(line.rstrip())
-                
-                # Remove trailing blank lines
-                while fixed_lines and not fixed_lines[-1].strip():
-                    fixed_lines.pop()
-                
-                # Ensure file ends with exactly one newline
-                content = '\n'.join(fixed_lines) + '\n'
-                
-                if content != original_content:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
-
-def fix_simple_issues():
-    """Fix simple, safe issues."""
-    print("Fixing simple issues...")
-    
-    for root, dirs, files in os.walk('src'):
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                original_content = content
-                
-                # Fix bare except (E722)
-                content = re.sub(r'except\s*:', 'except Exception:', content)
-                
-                # Fix ambiguous variable names (E741)
-                # Only fix obvious cases in assignments
-                content = re.sub(r'\bl\s*=\s*', 'lst = ', content)
-                content = re.sub(r'\bO\s*=\s*', 'obj = ', content)
-                content = re.sub(r'\bI\s*=\s*([^I])', r'idx = \1', content)
-                
-                if content != original_content:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
-
-def remove_unused_imports():
-    """Remove obviously unused imports."""
-    print("Removing unused imports...")
-    
-    common_unused = [
-        'import ast',
-        'import re',
-        'import sys', 
-        'import os',
-        'from typing import Dict',
-        'from typing import List',
-    ]
-    
-    for root, dirs, files in os.walk('src'):
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                original_content = content
-                lines = content.split('\n')
-                filtered_lines = []
-                
-                for line in lines:
-                    # Check if this is an unused import
-                    skip_line = False
-                    for unused_import in common_unused:
-                        if line.strip() == unused_import:
-                            # Check if the imported module is used later
-                            import_name = unused_import.split()[-1]
-                            rest_of_file = '\n'.join(lines[lines.index(line)+1:])
-                            if import_name not in rest_of_file:
-                                skip_line = True
-                                break
-                    
-                    if not skip_line:
-                        filtered_lines.append(line)
-                
-                content = '\n'.join(filtered_lines)
-                
-                if content != original_content:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
-
-def add_noqa_for_complex_issues():
-    """Add # noqa comments for complex issues that are hard to fix automatically."""
-    print("Adding # noqa for complex issues...")
-    
-    for root, dirs, files in os.walk('src'):
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                original_content = content
-                
-                # Add noqa for lambda assignments (E731)
-                content = re.sub(
-                    r'(\w+\s*=\s*lambda[^#\n]*?)(\s*#.*)?$',
-                    r'\1  # noqa: E731',
-                    content,
-                    flags=re.MULTILINE
-                )
-                
-                # Add noqa for star imports (F403, F405)
-                content = re.sub(
-                    r'(from .* import \*\s*)$',
-                    r'\1  # noqa: F403',
-                    content,
-                    flags=re.MULTILINE
-                )
-                
-                if content != original_content:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# flake8 is driven through its Python API to avoid an interpreter start per count
+try:
+    from flake8.api import legacy as flake8_api
+    from flake8.exceptions import Flake8Exception
+    from flake8.formatting.default import Default as Flake8Formatter
+    FLAKE8_AVAILABLE = True
+except ImportError:
+    FLAKE8_AVAILABLE = False
+
+_style_guide = None
+_flake8_messages = []
+
+if FLAKE8_AVAILABLE:
+    class CollectingFormatter(Flake8Formatter):
+        """flake8 formatter that keeps report lines instead of printing them."""
+        def _write(self, output):
+            _flake8_messages.append(output)
+
+# Files recorded as clean skip the transforms entirely: an unchanged
+# (mtime_ns, size) skips even reading the file, an unchanged sha256 skips
+# the fixes. Bump TRANSFORM_VERSION whenever a fix changes so stale entries
+# are dropped.
+CACHE_FILE = '.zero_lint_cache.json'
+TRANSFORM_VERSION = 5
+_cache = {}
+
+# Patterns are compiled once at import time and reused for every file
+_TRAILING_WS = re.compile(r'[ \t\r\f\v]+$', re.MULTILINE)
+_BARE_EXCEPT = re.compile(r'except\s*:')
+# Lines already tagged "# noqa: E731" don't match, so the count is meaningful
+_LAMBDA = re.compile(r'(\w+\s*=\s*lambda[^#\n]*?)(\s*#(?! noqa: E731$).*)?$', re.MULTILINE)
+_STAR_IMPORT = re.compile(r'(from .* import \*)[ \t]*$', re.MULTILINE)
+
+# Directories never descended into when collecting files
+SKIP_DIRS = frozenset({'__pycache__', '.git', '.venv', 'venv', 'node_modules'})
+
+def iter_python_files(root):
+    """Yield a DirEntry for every .py file under root, recursing with os.scandir."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from iter_python_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry
+
+def collect_python_files(root):
+    """List .py paths under root, largest first, so no big file straggles at the end."""
+    entries = sorted(iter_python_files(root), key=lambda e: e.stat().st_size, reverse=True)
+    return [entry.path for entry in entries]
+
+def fix_syntax_errors(content):
+    """Fix unterminated string literals. Returns (content, changed)."""
+    # Fix 4 quotes -> 3 quotes
+    if '""""' not in content:
+        return content, False
+    return content.replace('""""', '"""'), True
+
+def fix_whitespace_issues(content):
+    """Fix all whitespace-related issues. Returns (content, changed)."""
+    # Only rewrite when some rule is actually violated
+    if not ('\t' in content
+            or _TRAILING_WS.search(content)
+            or not content.endswith('\n')
+            or content.endswith('\n\n')):
+        return content, False
+    
+    # Fix tabs to spaces
+    content = content.expandtabs(4)
+    
+    # Remove trailing whitespace (including CR from CRLF line endings)
+    content = _TRAILING_WS.sub('', content)
+    
+    # Remove trailing blank lines and end with exactly one newline
+    return content.rstrip('\n') + '\n', True
+
+# Replacements for ambiguous single-letter names (E741)
+_AMBIGUOUS_NAMES = {'l': 'lst', 'O': 'obj', 'I': 'idx'}
+
+def rename_ambiguous_assignments(content):
+    """Rename l/O/I where they are assigned, leaving strings and comments alone.
+    
+    Returns (content, changed).
+    """
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(content).readline))
+    except (tokenize.TokenError, SyntaxError):
+        # Can't tokenize reliably, so don't touch anything
+        return content, False
+    
+    # Character offset at which each line starts, split exactly as readline()
+    # above does (on '\n' only) so token rows line up with these offsets
+    line_starts = [0]
+    for line in content.split('\n'):
+        line_starts.append(line_starts[-1] + len(line) + 1)
+    
+    edits = []
+    depth = 0
+    # Bracket depths of the lambdas whose parameter list we are inside
+    lambda_depths = []
+    for tok, next_tok in zip(tokens, tokens[1:]):
+        if tok.type == tokenize.OP and tok.string in '([{':
+            depth += 1
+        elif tok.type == tokenize.OP and tok.string in ')]}':
+            depth -= 1
+        elif tok.type == tokenize.NAME and tok.string == 'lambda':
+            lambda_depths.append(depth)
+        elif (tok.type == tokenize.OP and tok.string == ':'
+                and lambda_depths and lambda_depths[-1] == depth):
+            lambda_depths.pop()
+        # Only plain assignments; inside brackets "name=" is a keyword
+        # argument and inside "lambda ...:" it is a parameter default
+        elif (depth == 0 and not lambda_depths
+                and tok.type == tokenize.NAME
+                and tok.string in _AMBIGUOUS_NAMES
+                and next_tok.type == tokenize.OP and next_tok.string == '='):
+            row, col = tok.start
+            offset = line_starts[row - 1] + col
+            # Never splice unless the offset really points at this name
+            if content[offset:offset + 1] == tok.string:
+                edits.append((offset, tok.string))
+    
+    # Splice from the end so earlier offsets stay valid
+    for offset, name in reversed(edits):
+        content = content[:offset] + _AMBIGUOUS_NAMES[name] + content[offset + 1:]
+    return content, bool(edits)
+
+def fix_simple_issues(content):
+    """Fix simple, safe issues. Returns (content, changed)."""
+    changed = False
+    
+    # Fix bare except (E722)
+    if 'except' in content:
+        content, count = _BARE_EXCEPT.subn('except Exception:', content)
+        changed = count > 0
+    
+    # Fix ambiguous variable names (E741)
+    content, renamed = rename_ambiguous_assignments(content)
+    return content, changed or renamed
+
+# Import lines that are often left unused, mapped to the name they bind
+_UNUSED_IMPORTS = {
+    'import ast': 'ast',
+    'import re': 're',
+    'import sys': 'sys',
+    'import os': 'os',
+    'from typing import Dict': 'Dict',
+    'from typing import List': 'List',
+}
+
+def remove_unused_imports(content):
+    """Remove obviously unused imports. Returns (content, changed)."""
+    filtered_lines = []
+    removed = False
+    # Offset in content just past the current line, so "used later" is a
+    # single find() instead of re-joining the rest of the file per import
+    end = 0
+    
+    for line in content.split('\n'):
+        end += len(line) + 1
+        # Drop the import if the imported name is not used later
+        import_name = _UNUSED_IMPORTS.get(line.strip())
+        if import_name is not None and content.find(import_name, end) == -1:
+            removed = True
+        else:
+            filtered_lines.append(line)
+    
+    if not removed:
+        return content, False
+    return '\n'.join(filtered_lines), True
+
+def add_noqa_for_complex_issues(content):
+    """Add # noqa comments for complex issues that are hard to fix automatically.
+    
+    Returns (content, changed).
+    """
+    lambdas = star_imports = 0
+    
+    # Add noqa for lambda assignments (E731)
+    if 'lambda' in content:
+        content, lambdas = _LAMBDA.subn(r'\1  # noqa: E731', content)
+    
+    # Add noqa for star imports (F403, F405)
+    if 'import *' in content:
+        content, star_imports = _STAR_IMPORT.subn(r'\1  # noqa: F403', content)
+    
+    return content, lambdas + star_imports > 0
+
+# Fixes in order of safety; each takes file content and returns
+# (content, changed) so callers never have to compare whole files
+TRANSFORMS = (
+    fix_syntax_errors,
+    fix_whitespace_issues,
+    fix_simple_issues,
+    remove_unused_imports,
+    add_noqa_for_complex_issues,
+)
+
+def transform(content):
+    """Apply every fix to a file's content in memory. Returns (content, changed)."""
+    dirty = False
+    for fix in TRANSFORMS:
+        content, changed = fix(content)
+        dirty = dirty or changed
+    return content, dirty
+
+def load_cache():
+    """Load {path: {mtime_ns, size, sha256}} for files known to be clean."""
+    try:
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != TRANSFORM_VERSION:
+        return {}
+    return cache.get('files', {})
+
+def save_cache(entries):
+    """Persist the entries of files the transforms leave unchanged."""
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'version': TRANSFORM_VERSION, 'files': entries}, f)
+
+def _init_worker(cache):
+    """Give each pool worker the cache of known-clean files."""
+    global _cache
+    _cache = cache
+
+def process_file(filepath):
+    """Read, fix and (if changed) write one file.
+    
+    Returns (written, entry) where entry is the file's new cache entry if the
+    transforms left it unchanged, else None.
+    """
+    # Resolve symlinks so the rename below replaces the target, not the link
+    path = Path(os.path.realpath(filepath))
+    st = path.stat()
+    entry = _cache.get(filepath)
+    if entry and (st.st_mtime_ns, st.st_size) == (entry['mtime_ns'], entry['size']):
+        return False, entry
+    raw = path.read_bytes()
+    # A NUL near the start means this is not a text file; leave it alone
+    if b'\x00' in raw[:512]:
+        return False, None
+    digest = hashlib.sha256(raw).hexdigest()
+    clean = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': digest}
+    # Touched but identical content: refresh the stat fields only
+    if entry and entry['sha256'] == digest:
+        return False, clean
+    content = raw.decode('utf-8')
+    fixed, dirty = transform(content)
+    if not dirty:
+        return False, clean
+    # Write next to the target and rename over it, so an interrupted run
+    # never leaves a half-written source file behind
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(fixed.encode('utf-8'))
+    os.chmod(tmp, st.st_mode)
+    os.replace(tmp, path)
+    return True, None
+
+def run_flake8():
+    """Lint src once, returning (error count, formatted report lines)."""
+    global _style_guide
+    if not FLAKE8_AVAILABLE:
+        return -1, []
+    _flake8_messages.clear()
+    try:
+        # Run flake8 in-process, building the style guide only once per run
+        if _style_guide is None:
+            _style_guide = flake8_api.get_style_guide(quiet=2)
+            _style_guide.init_report(CollectingFormatter)
+        report = _style_guide.check_files(['src'])
+    except (Flake8Exception, OSError) as e:
+        print(f"flake8 failed: {e}")
+        return -1, []
+    return report.total_errors, list(_flake8_messages)
 
 def get_error_count():
     """Get total flake8 error count."""
-    try:
-        result = subprocess.run(
-            ['python', '-m', 'flake8', 'src', '--count'],
-            capture_output=True, text=True
-        )
-        output = result.stdout.strip()
-        if output.isdigit():
-            return int(output)
-        return 0
-    except:
-        return -1
+    return run_flake8()[0]
 
 def main():
     """Main function to achieve zero linting errors."""
     print("=== FINAL ZERO-LINT ACHIEVEMENT SCRIPT ===")
     
+    # Walk and size the tree once; the fix pass reuses this ordering
+    all_py = collect_python_files('src')
+    
     initial_errors = get_error_count()
     print(f"Initial total errors: {initial_errors}")
     
-    # Fix issues in order of safety
-    fix_syntax_errors()
-    print(f"After syntax fixes: {get_error_count()} errors")
+    # Don't rewrite files when the tree can't even be linted
+    if initial_errors < 0:
+        print("Could not run flake8 - aborting without changing any files")
+        return
     
-    fix_whitespace_issues()
-    print(f"After whitespace fixes: {get_error_count()} errors")
-    
-    fix_simple_issues()
-    print(f"After simple fixes: {get_error_count()} errors")
+    # Nothing to fix: skip the fix pass and the final lint altogether
+    if initial_errors == 0:
+        print("\n🎉🎉🎉 ABSOLUTE ZERO LINTING ERRORS ACHIEVED! 🎉🎉🎉")
+        print("The MatchInsurance codebase is already 100% lint-free!")
+        return
     
-    remove_unused_imports()
-    print(f"After import cleanup: {get_error_count()} errors")
+    # Apply all fixes in a single pass over the tree
+    print("Fixing syntax, whitespace, simple issues, unused imports and adding # noqa...")
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(all_py) // (workers * 4))
+    cache = load_cache()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(cache,)
+    ) as executor:
+        results = list(executor.map(process_file, all_py, chunksize=chunksize))
+    changed = sum(written for written, _ in results)
+    save_cache({
+        path: entry for path, (_, entry) in zip(all_py, results) if entry is not None
+    })
+    print(f"Updated {changed} files")
     
-    add_noqa_for_complex_issues()
-    final_errors = get_error_count()
-    print(f"After noqa additions: {final_errors} errors")
+    # One final lint provides both the count and the report to show
+    final_errors, messages = run_flake8()
+    print(f"After all fixes: {final_errors} errors")
     
     print(f"\nTotal improvement: {initial_errors - final_errors} fewer errors")
     
@@ -224,11 +341,7 @@ def main():
         print("The MatchInsurance codebase is now 100% lint-free!")
     else:
         print(f"\nRemaining {final_errors} errors - checking what's left...")
-        result = subprocess.run(
-            ['python', '-m', 'flake8', 'src'],
-            capture_output=True, text=True
-        )
-        print(result.stdout)
+        print('\n'.join(messages))
 
 if __name__ == "__main__":
     main()